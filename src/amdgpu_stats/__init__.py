@@ -1,10 +1,22 @@
 """__init__.py for amdgpu-stats"""
 
+import argparse
+import os
 import sys
-from .tui import app
-from .utils import (
-        CARDS,
-)
+from typing import Optional
+from .utils import get_cards
+
+
+def __getattr__(name: str):
+    """Provides the TUI `app` class and `CARDS` on first access
+
+    Importing the package doesn't load `textual` or search for cards"""
+    if name == 'app':
+        from .tui import app  # pylint: disable=import-outside-toplevel
+        return app
+    if name == 'CARDS':
+        return get_cards()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def check_for_cards() -> bool:
@@ -12,14 +24,52 @@ def check_for_cards() -> bool:
 
     Returns:
         bool: If any AMD cards found or not"""
-    if len(CARDS) > 0:
+    if len(get_cards()) > 0:
         return True
     return False
 
 
+def set_batch_scheduling() -> bool:
+    """Switches this process to the `SCHED_BATCH` policy, see `sched(7)`
+
+    The TUI wakes briefly/regularly to read stats; as a 'batch' task it has lower scheduling
+    priority, contending less for CPU time with interactive tasks (at the cost of a wakeup penalty)
+
+    Returns:
+        bool: If the policy was applied; not all platforms/Python builds support it"""
+    try:
+        os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def parse_args(args: Optional[list] = None) -> argparse.Namespace:
+    """Parses command line arguments for the TUI
+
+    Args:
+        args (list, optional): Arguments to parse; defaults to `sys.argv`
+
+    Returns:
+        argparse.Namespace: The parsed arguments"""
+    parser = argparse.ArgumentParser(prog='amdgpu-stats',
+                                     description='A TUI for AMD GPU statistics')
+    parser.add_argument('--batched',
+                        action='store_true',
+                        help="run with the 'SCHED_BATCH' scheduling policy; "
+                             "lowers scheduling priority/CPU contention")
+    return parser.parse_args(args)
+
+
 def textual_run() -> None:
     """runs the AMD GPU Stats TUI; called only when in an interactive shell"""
+    args = parse_args()
     if check_for_cards():
+        if args.batched and not set_batch_scheduling():
+            print("Warning: could not apply the 'SCHED_BATCH' scheduling policy, "
+                  "continuing without it", file=sys.stderr)
+        # deferred; only load the TUI (and 'textual') when it'll be run
+        from .tui import app  # pylint: disable=import-outside-toplevel
         amdgpu_stats_app = app(watch_css=True)
         amdgpu_stats_app.run()
     else:
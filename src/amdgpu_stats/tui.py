@@ -10,10 +10,12 @@ Classes:
     - GPUStatsWidget: the primary container for the tabbed content; stats table / logs
 
 Functions:
-    - start: Creates the 'App' and renders the TUI using the classes above
+    - humanize: formats stats for the table, adding units
 """
 # disable superfluouos linting
 # pylint: disable=line-too-long
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -35,19 +37,55 @@ from textual.widgets import (
         )
 
 from .utils import (
-        CARDS,
-        get_fan_rpm,
-        get_power_stats,
-        get_temp_stat,
-        get_clock,
-        get_gpu_usage,
-        get_voltage,
+        format_frequency,
+        get_all_stats,
+        get_cards,
 )
+# the TUI shows all AMD GPUs; discover them now (if not already)
+CARDS = get_cards()
 # rich markup reference:
 #    https://rich.readthedocs.io/en/stable/markup.html
 
-
-class GPUStatsWidget(Static):
+# columns of the stats table, in order; keys of 'get_column_data_mapping'
+STAT_COLUMNS = (
+    "Card",
+    "Core clock",
+    "Memory clock",
+    "Usage",
+    "Voltage",
+    "Power",
+    "Limit",
+    "Default",
+    "Capability",
+    "Fan RPM",
+    "Edge temp",
+    "Junction temp",
+    "Memory temp",
+)
+# the column listing written to the log on startup; built once
+STAT_COLUMNS_LOG = tuple(f"  - '{column}'" for column in STAT_COLUMNS)
+# columns shown in italics; limits, rather than measurements
+ITALIC_COLUMNS = ('Limit', 'Default', 'Capability')
+# temperature columns and the temperature (node name) shown in each
+TEMP_COLUMNS = (('Edge temp', 'edge'),
+                ('Junction temp', 'junction'),
+                ('Memory temp', 'mem'))
+
+
+def humanize(value, unit: str, missing: str) -> str:
+    """'humanize' a stat for the table, adding `unit`
+
+    Args:
+        value: The stat; if None, `missing` is returned instead
+        unit (str): Suffix to apply, ie: `W` or `C`
+        missing (str): Shown in place of stats the card doesn't provide
+    """
+    if value is None:
+        return missing
+    return f'{value}{unit}'
+
+
+class GPUStatsWidget(Static):  # pylint: disable=too-many-instance-attributes
     """The main stats widget."""
 
     def get_column_data_mapping(self, card: Optional[str] = None) -> dict:
@@ -55,80 +93,69 @@ class GPUStatsWidget(Static):
 
         Columns are derived from keys, and values provide measurements
         *Measurements require `card`*'''
-        # handle varying stats (among cards) independently
-        #
-        # first, a subset of the power stats - gather them all
-        # ... then map to a smaller dict that's used to update the table
-        _all_pwr = get_power_stats(card=card)
-        power_stats = {
-                "usage": _all_pwr["usage"],
-                "lim": _all_pwr["limit"],
-                "def": _all_pwr["default"],
-                "cap": _all_pwr["capability"],
-                }
-
-        temp_stats = {
-                "edge": get_temp_stat(name='edge', card=card),
-                "junction": get_temp_stat(name='junction', card=card),
-                "memory": get_temp_stat(name='mem', card=card)
-                }
-
-        # 'humanize' values, add units
-        for power_stat, val in power_stats.items():
-            if val is None:
-                power_stats[power_stat] = 'Unknown'
-            else:
-                power_stats[power_stat] = str(val) + 'W'
-        for temp_stat, val in temp_stats.items():
-            if val is None:
-                temp_stats[temp_stat] = 'N/A'
-            else:
-                temp_stats[temp_stat] = str(val) + 'C'
-
         if card is None:
-            return {
-                "Card": "",
-                "Core clock": "",
-                "Memory clock": "",
-                "Usage": "",
-                "Voltage": "",
-                "Power": "",
-                "Limit": "",
-                "Default": "",
-                "Capability": "",
-                "Fan RPM": "",
-                "Edge temp": "",
-                "Junction temp": "",
-                "Memory temp": ""
-            }
-        return {
+            return dict.fromkeys(STAT_COLUMNS, "")
+        # sample everything in one call; 'card' is resolved once, stats are read together
+        # values are formatted straight into the row
+        stats = get_all_stats(card=card)
+        row = {
             "Card": card,
-            "Core clock": get_clock('core', card=card, format_freq=True),
-            "Memory clock": get_clock('memory', card=card, format_freq=True),
-            "Usage": f'{get_gpu_usage(card=card)}%',
-            "Voltage": f'{get_voltage(card=card)}V',
-            "Power": power_stats['usage'],
-            "Limit": power_stats['lim'],
-            "Default": power_stats['def'],
-            "Capability": power_stats['cap'],
-            "Fan RPM": f'{get_fan_rpm(card=card)}',
-            "Edge temp": temp_stats['edge'],
-            "Junction temp": temp_stats['junction'],
-            "Memory temp": temp_stats['memory']
+            "Core clock": None if stats['sclk'] is None else format_frequency(stats['sclk']),
+            "Memory clock": None if stats['mclk'] is None else format_frequency(stats['mclk']),
+            "Usage": f'{stats["util_pct"]}%',
+            "Voltage": f'{stats["voltage"]}V',
+            "Power": humanize(stats['usage'], 'W', 'Unknown'),
+            "Limit": humanize(stats['limit'], 'W', 'Unknown'),
+            "Default": humanize(stats['default'], 'W', 'Unknown'),
+            "Capability": humanize(stats['capability'], 'W', 'Unknown'),
+            "Fan RPM": f'{stats["fan_rpm"]}',
         }
+        temp_stats = stats['temps']
+        for column, temp_name in TEMP_COLUMNS:
+            row[column] = humanize(temp_stats.get(temp_name), 'C', 'N/A')
+        return row
 
     # initialize empty/default instance vars and objects
-    data = {}
     stats_table = None
     tabbed_container = None
     text_log = None
     timer_stats = None
-    # mark the table as needing initialization (with rows)
-    table_needs_init = True
+    util_bars = None
+    # ids of the usage bars, by card
+    util_bar_ids = None
+    # sampled stats waiting to be drawn, by card; drained by 'render_stats'
+    stats_queue = None
+    render_pending = False
+    # the stats currently shown for each card; only cells that differ are redrawn
+    # cards without any are yet to be added to the table (as rows)
+    rendered_stats = None
+    # if stats are being collected; paused while no stats are on screen (ie: 'Logs' tab)
+    polling = True
+    # stats are collected every 'POLL_INTERVAL' seconds while they change
+    # after 'POLL_BACKOFF_AFTER' unchanged samples, the interval doubles; up to 'POLL_INTERVAL_MAX'
+    POLL_INTERVAL = 1.0
+    POLL_INTERVAL_MAX = 8.0
+    POLL_BACKOFF_AFTER = 3
+    poll_interval = POLL_INTERVAL
+    unchanged_polls = 0
+    # the previous sample for each card, to tell if anything changed
+    last_stats = None
+    # cards are sampled concurrently by 'stats_pool'; reads still in progress are kept by card
+    stats_pool = None
+    pending_samples = None
+    # minimum time between redraws of the table/bars, in seconds; caps them at 10 Hz
+    RENDER_INTERVAL = 0.1
 
     def __init__(self, *args, cards=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.cards = cards
+        self.util_bar_ids = {card: f'bar_{card}_util' for card in (cards or ())}
+        self.stats_queue = {}
+        self.rendered_stats = {}
+        self.last_stats = {}
+        self.pending_samples = {}
+        self.stats_pool = ThreadPoolExecutor(max_workers=max(1, min(4, len(cards or ()))),
+                                             thread_name_prefix='amdgpu_stats')
         self.text_log = Log(highlight=True,
                             name='log_gpu',
                             classes='logs')
@@ -143,19 +170,23 @@ class GPUStatsWidget(Static):
         '''Fires when stats widget 'mounted', behaves like on first showing'''
         self.update_log("App started, logging begin!")
         # construct the table columns
-        columns = list(self.get_column_data_mapping(None).keys())
         self.update_log('Stat columns:')
-        for column in columns:
-            self.update_log(f"  - '{column}'", show_ts=False)
-            if column in ['Limit', 'Default', 'Capability']:
+        # one write for the whole list, rather than a log refresh per column
+        self.text_log.write_lines(STAT_COLUMNS_LOG)
+        for column in STAT_COLUMNS:
+            if column in ITALIC_COLUMNS:
                 self.stats_table.add_column(label='[italic]' + column,
                                             key=column)
             else:
                 self.stats_table.add_column(label=column, key=column)
-        # do a one-off stat collection, populate table before the interval
+        # resolve the usage bars once; saves a DOM query per card, every update
+        self.util_bars = {card: self.query_one(f'#{bar_id}', ProgressBar) for card, bar_id in self.util_bar_ids.items()}
+        # collect stats now, populating the table; each collection schedules the next
         self.get_stats()
-        # stand up the stat-collecting interval, twice per second
-        self.timer_stats = self.set_interval(1.0, self.get_stats)
+
+    def on_unmount(self) -> None:
+        '''Fires when stats widget 'unmounted'; lets go of the stat-reading threads'''
+        self.stats_pool.shutdown(wait=False)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -163,13 +194,13 @@ class GPUStatsWidget(Static):
             with TabPane("Stats", id="tab_stats"):
                 yield self.stats_table
             with TabPane("Graphs", id="tab_graphs", classes="tab_graphs"):
-                for card in CARDS:
+                for card, bar_id in self.util_bar_ids.items():
                     yield Vertical(
                             Label(f'[bold]{card}'),
                             Label('Core:'),
                             ProgressBar(total=100.0,
                                         show_eta=False,
-                                        id='bar_' + card + '_util'),
+                                        id=bar_id),
                             )
             with TabPane("Logs", id="tab_logs"):
                 yield self.text_log
@@ -185,40 +216,108 @@ class GPUStatsWidget(Static):
             message = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}"
         self.text_log.write_line(message)
 
+    def set_polling(self, active: bool) -> None:
+        """Pause or resume stat collection; no sysfs reads happen while paused
+
+        Args:
+            active (bool): If True, resumes collection (with an immediate update). Otherwise, pauses it.
+        """
+        if active == self.polling:
+            return
+        self.polling = active
+        if self.timer_stats is not None:
+            self.timer_stats.stop()
+        if active:
+            # refresh now at the regular interval, rather than showing stale values
+            self.poll_interval = self.POLL_INTERVAL
+            self.unchanged_polls = 0
+            self.get_stats()
+        self.update_log(f"Stat collection {'resumed' if active else 'paused'}")
+
     @work(exclusive=True)
     async def get_stats(self):
-        '''Function to fetch stats / update the table for each AMD GPU found'''
+        '''Function to fetch stats for each AMD GPU found, queueing them to be drawn'''
+        # read each card in the pool; one stuck on a slow sysfs read doesn't hold up the others
         for card in self.cards:
-            self.data = self.get_column_data_mapping(card)
+            if card not in self.pending_samples:
+                self.pending_samples[card] = self.stats_pool.submit(self.get_column_data_mapping, card)
+        # wait without blocking the event loop; input/rendering carry on if the driver stalls
+        await asyncio.wait([asyncio.wrap_future(future) for future in self.pending_samples.values()],
+                           timeout=self.POLL_INTERVAL * 0.9)
+        sample = {}
+        for card, future in list(self.pending_samples.items()):
+            if future.done():
+                del self.pending_samples[card]
+                sample[card] = future.result()
+            elif card in self.last_stats:
+                # still reading; keep the previous stats, check again next time
+                sample[card] = self.last_stats[card]
+        # queue cards with new stats; steady cards skip rendering entirely
+        changed = {card: data for card, data in sample.items() if data != self.last_stats.get(card)}
+        if changed:
+            # only the latest sample for each card is kept; bursts coalesce into one redraw
+            self.stats_queue.update(changed)
+            if not self.render_pending:
+                self.render_pending = True
+                self.set_timer(self.RENDER_INTERVAL, self.render_stats)
+        self.schedule_stats(changed=bool(changed))
+        self.last_stats = sample
+
+    def schedule_stats(self, changed: bool = True) -> None:
+        '''Schedules the next `get_stats`, backing off the interval while stats are steady
 
+        Args:
+            changed (bool, optional): If the latest sample differs from the one before it
+        '''
+        if not changed:
+            self.unchanged_polls += 1
+            if self.unchanged_polls >= self.POLL_BACKOFF_AFTER:
+                self.poll_interval = min(self.poll_interval * 2, self.POLL_INTERVAL_MAX)
+                self.unchanged_polls = 0
+        else:
+            # something changed, snap back to the regular interval
+            self.poll_interval = self.POLL_INTERVAL
+            self.unchanged_polls = 0
+        if self.timer_stats is not None:
+            self.timer_stats.stop()
+        if self.polling:
+            self.timer_stats = self.set_timer(self.poll_interval, self.get_stats)
+
+    def render_stats(self) -> None:
+        '''Drains the queue filled by `get_stats`, updating the table/bars for each card'''
+        self.render_pending = False
+        queued, self.stats_queue = self.stats_queue, {}
+        for card, data in queued.items():
+            shown = self.rendered_stats.get(card)
             # handle the table data appopriately
             # if needs populated anew or updated
-            if self.table_needs_init:
+            if shown is None:
                 # Add rows for the first time
                 # Adding right-justified `Text` objects instead of plain strings
                 styled_row = [
-                    Text(str(cell), style="normal", justify="right") for cell in self.data.values()
+                    Text(str(cell), style="normal", justify="right") for cell in data.values()
                 ]
                 self.stats_table.add_row(*styled_row, key=card)
                 hwmon_dir = CARDS[card]
                 self.update_log(f"Added row for '{card}', stats dir: '{hwmon_dir}'")
             else:
-                # Update existing table rows, retaining styling/justification
-                for column, value in self.data.items():
+                # Update changed cells in existing table rows, retaining styling/justification
+                for column, value in data.items():
+                    if shown[column] == value:
+                        continue
                     self.stats_table.update_cell(card,
                                                  column,
                                                  Text(str(value),
                                                       style="normal",
                                                       justify="right"))
+            self.rendered_stats[card] = data
 
-            # Update usage bars
-            if self.data['Usage'] is not None:
-                self.query_one(f'#bar_{card}_util').update(total=100,
-                                                           progress=float(self.data['Usage'].replace('%', '')))
-
-        if self.table_needs_init:
-            # if this is the first time updating the table, mark it initialized
-            self.table_needs_init = False
+            # Update usage bars, if changed
+            if shown is not None and shown['Usage'] == data['Usage']:
+                continue
+            if data['Usage'] is not None:
+                self.util_bars[card].update(total=100,
+                                            progress=float(data['Usage'].replace('%', '')))
 
 
 class app(App):  # pylint: disable=invalid-name
@@ -327,6 +426,8 @@ class app(App):  # pylint: disable=invalid-name
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated):
         """Listens to 'TabActivated' event, sets subtitle"""
         active_tab = event.tabbed_content.active.replace('tab_', '')
+        # only collect stats while a tab showing them is active
+        self.stats_widget.set_polling(active_tab != "logs")
         if active_tab == "logs":
             self.sub_title = active_tab  # pylint: disable=attribute-defined-outside-init
         elif active_tab == "stats":
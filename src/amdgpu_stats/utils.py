@@ -7,14 +7,37 @@ Variables:
     - CARDS (dict): discovered AMD GPUs and their `hwmon` stats directories
         - Example: `{'card0': '/sys/class/drm/card0/device/hwmon/hwmon9'}`
         - If no *AMD* cards are found, this will be empty.
+        - Discovered on first access, not at import; see `get_cards()`
     - CLOCK_DOMAINS (tuple): supported clock domains, ie: `('core', 'memory')`
+    - POWER_STATIC_FILES (tuple): `(key, CardPaths field)` pairs of fixed power stats, read once
+    - POWER_USAGE_FILES (tuple): `CardPaths` fields of files providing power usage, by preference
+    - FREQUENCY_UNITS (tuple): `(divisor, suffix)` pairs used by `format_frequency`
 """
 # disable superfluous linting
 # pylint: disable=line-too-long
-from os import path
-import glob
-from typing import Optional, Union
-from humanfriendly import format_size
+import atexit
+import os
+from functools import lru_cache
+from typing import NamedTuple, Optional, Union
+
+
+def _read_once(file: str, size: int = 128) -> bytes:
+    """
+    Read up to `size` bytes of `file`, without keeping it open; for files read once, ie: labels
+
+    Uses `os.open`/`os.read` directly, skipping the buffering and text layers of `open()`
+
+    Raises:
+        OSError: If `file` can't be read, ie: it doesn't exist
+
+    Returns:
+        bytes: Contents of `file`, including any trailing newline
+    """
+    _fd = os.open(file, os.O_RDONLY)
+    try:
+        return os.read(_fd, size)
+    finally:
+        os.close(_fd)
 
 
 def find_cards() -> dict:
@@ -31,24 +54,183 @@ def find_cards() -> dict:
         dict: `{'cardN': '/hwmon/directory/with/stat/files', 'cardY': '/other/hwmon/directory/for/cardY'}`
     """
     cards = {}
-    card_glob_pattern = '/sys/class/drm/card*/device/hwmon/hwmon*/name'
-    hwmon_names = glob.glob(card_glob_pattern)
-    for hwmon_name_file in hwmon_names:
-        with open(hwmon_name_file, "r", encoding="utf-8") as _f:
-            if _f.read().strip() == 'amdgpu':
-                # found an amdgpu
-                _card = hwmon_name_file.split('/')[4]
-                _hwmon_dir = path.dirname(hwmon_name_file)
-                cards[_card] = _hwmon_dir
+    # walk 'card*/device/hwmon/hwmon*' with 'scandir'; one directory read per level, no pattern matching
+    try:
+        drm_entries = os.scandir('/sys/class/drm')
+    except OSError:
+        # no DRM devices at all, nothing to find
+        return {}
+    with drm_entries:
+        for drm_entry in drm_entries:
+            # skip render nodes and connectors, ie: 'renderD128' or 'card0-DP-1'
+            if not drm_entry.name.startswith('card') or '-' in drm_entry.name:
+                continue
+            try:
+                hwmon_entries = os.scandir(f"{drm_entry.path}/device/hwmon")
+            except OSError:
+                continue
+            with hwmon_entries:
+                for hwmon_entry in hwmon_entries:
+                    # compare raw bytes; no need to decode a name that's 'amdgpu' or not
+                    try:
+                        hwmon_name = _read_once(f"{hwmon_entry.path}/name", 16)
+                    except OSError:
+                        continue
+                    if hwmon_name.strip() == b'amdgpu':
+                        # found an amdgpu; a card has one, skip its other hwmon entries
+                        cards[drm_entry.name] = hwmon_entry.path
+                        break
     return dict(sorted(cards.items()))
 
 
-# discover all available AMD GPUs
-CARDS = find_cards()
+class CardPaths(NamedTuple):
+    """
+    Stat file paths for a card, joined once at discovery rather than on every read
+
+    Built for each of `CARDS` by `get_cards()`; see `get_card_paths()`
+    """
+    hwmon_dir: str
+    power_cap: str
+    power_average: str
+    power_input: str
+    power_cap_max: str
+    power_cap_default: str
+    sclk: str
+    mclk: str
+    voltage: str
+    fan_input: str
+    fan_target: str
+    busy_pct: str
+    temp_nodes: dict
+
+
+def _find_temp_nodes(hwmon_dir: str) -> dict:
+    """
+    Finds the temperature `nodes` in `hwmon_dir`, reading their labels
+
+    Returns:
+        dict: Temperature node names and their value files, ie: `{'edge': '/.../temp1_input'}`
+    """
+    temp_files = {}
+    try:
+        hwmon_entries = os.scandir(hwmon_dir)
+    except OSError:
+        return temp_files
+    # one directory read, filtered by name; no per-entry 'stat' or pattern matching like 'glob'
+    with hwmon_entries:
+        temp_node_labels = sorted(entry.name for entry in hwmon_entries
+                                  if entry.name.startswith('temp') and entry.name.endswith('_label'))
+    for temp_node_label in temp_node_labels:
+        # determine the base node id, eg: temp1
+        # read the file that labels it. ie: edge/junction
+        temp_node_id = temp_node_label.split('_')[0]
+        try:
+            temp_node_name = _read_once(f"{hwmon_dir}/{temp_node_label}", 32).strip().decode('utf-8')
+        except OSError:
+            continue
+        # add the node name/type and the corresponding temp file to the dict
+        temp_files[temp_node_name] = f"{hwmon_dir}/{temp_node_id}_input"
+    return temp_files
+
+
+def _build_card_paths(card: str, hwmon_dir: str) -> CardPaths:
+    """Joins the stat file paths for `card`, and finds its temperature nodes; see `CardPaths`"""
+    return CardPaths(hwmon_dir=hwmon_dir,
+                     power_cap=f"{hwmon_dir}/power1_cap",
+                     power_average=f"{hwmon_dir}/power1_average",
+                     power_input=f"{hwmon_dir}/power1_input",
+                     power_cap_max=f"{hwmon_dir}/power1_cap_max",
+                     power_cap_default=f"{hwmon_dir}/power1_cap_default",
+                     sclk=f"{hwmon_dir}/freq1_input",
+                     mclk=f"{hwmon_dir}/freq2_input",
+                     voltage=f"{hwmon_dir}/in0_input",
+                     fan_input=f"{hwmon_dir}/fan1_input",
+                     fan_target=f"{hwmon_dir}/fan1_target",
+                     busy_pct=f"/sys/class/drm/{card}/device/gpu_busy_percent",
+                     temp_nodes=_find_temp_nodes(hwmon_dir))
+
+
+# discovered AMD GPUs, provided as 'CARDS'; found on first use rather than at import
+_CARDS = None
+# 'CardPaths' for each of 'CARDS', built along with them
+_CARD_PATHS = {}
+
+
+def get_cards() -> dict:
+    """
+    Returns the discovered AMD GPUs, `CARDS`. Searches with `find_cards()` on first use
+
+    Importing this module does not search for cards, this (or `CARDS`) does
+
+    Returns:
+        dict: `{'cardN': '/hwmon/directory/with/stat/files'}`, see `find_cards()`
+    """
+    global _CARDS  # pylint: disable=global-statement
+    if _CARDS is None:
+        cards = find_cards()
+        _CARD_PATHS.update((card, _build_card_paths(card, hwmon_dir)) for card, hwmon_dir in cards.items())
+        _CARDS = cards
+    return _CARDS
+
+
+def get_card_paths(card: Optional[str] = None) -> CardPaths:
+    """
+    Args:
+        card (str, optional): ie: `card0`. See `CARDS` or `find_cards()`
+
+    Raises:
+        ValueError: If *no* AMD cards are found, or `card` is not one of them.
+            Determined with `CARDS`
+
+    Returns:
+        CardPaths: Paths to the stat files of `card`, joined at discovery
+    """
+    # a known card costs one lookup; anything else (ie: `None`, or cards not found yet) is validated
+    try:
+        return _CARD_PATHS[card]
+    except KeyError:
+        return _CARD_PATHS[validate_card(card)]
+
+
+def __getattr__(name: str):
+    """Provides `CARDS` as a module attribute, discovering cards on first access"""
+    if name == 'CARDS':
+        return get_cards()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # supported clock domains by 'get_clock' func
-# is concatenated with 'clock_' to index SRC_FILES for the relevant data file
 CLOCK_DOMAINS = ('core', 'memory')
-# defined outside/globally for efficiency -- it's called a lot in the TUI
+# the 'CardPaths' field with the clock file for each of 'CLOCK_DOMAINS'; validates and dispatches in one lookup
+_CLOCK_FIELDS = {'core': 'sclk',
+                 'memory': 'mclk'}
+# power stats fixed by the hardware/driver, with the 'CardPaths' field of the file providing each
+# read on the first 'get_power_stats' for a card, then reused; the limit and usage are polled
+POWER_STATIC_FILES = (('capability', 'power_cap_max'),
+                      ('default', 'power_cap_default'))
+# files that may provide power usage, by preference; GPUs/drivers offer averaged and/or instant readouts
+POWER_USAGE_FILES = ('power_average', 'power_input')
+# (divisor, suffix) used by 'format_frequency', largest first
+FREQUENCY_UNITS = ((1000000000, 'GHz'),
+                   (1000000, 'MHz'),
+                   (1000, 'kHz'))
+# sysfs stat files opened by 'read_stat', mapped to their (kept open) file descriptors
+# re-reading with 'os.pread' avoids the open/close and path resolution on every update
+_FD_CACHE = {}
+# bytes requested by each stat read; sysfs attributes are at most a page (PAGE_SIZE), read them whole
+_READ_SIZE = 4096
+
+
+def _close_cached_fds() -> None:
+    """Closes the file descriptors kept open by `read_stat`; registered with `atexit`"""
+    for _fd in _FD_CACHE.values():
+        os.close(_fd)
+    _FD_CACHE.clear()
+
+
+atexit.register(_close_cached_fds)
+# 'POWER_STATIC_FILES' stats, by card 'hwmon' directory
+_POWER_STATIC = {}
 
 
 def validate_card(card: Optional[str] = None) -> str:
@@ -69,23 +251,47 @@ def validate_card(card: Optional[str] = None) -> str:
             If `card` is provided and valid: original identifier `card` is returned
             If `card` is omitted: the first AMD GPU identifier is returned
     """
-    if card in CARDS:
+    cards = get_cards()
+    if card in cards:
         # card was provided and checks out, send it back
         return card
     if card is None:
         # if no card provided and we know some, send the first one we know back
-        if len(CARDS) > 0:
-            return list(CARDS.keys())[0]
+        # first key, without building a list of them all
+        if cards:
+            return next(iter(cards))
         # if no AMD cards found, toss an errror
         raise ValueError("No AMD GPUs or hwmon directories found")
     # if 'card' was specified (not None) but invalid (not in 'CARDS'), raise a helpful error
-    raise ValueError(f"Invalid card: '{card}'. Must be one of: {list(CARDS.keys())}")
+    raise ValueError(f"Invalid card: '{card}'. Must be one of: {list(cards)}")
+
+
+def _read_raw(file: str) -> Optional[bytes]:
+    """
+    Read the raw contents of statistic `file`, opening it only on first use
+
+    The file is kept open; reads use `os.pread` from the start
+
+    Returns:
+        bytes: Contents of `file`, including any trailing newline
+        None: If `file` doesn't exist
+    """
+    _fd = _FD_CACHE.get(file)
+    if _fd is None:
+        try:
+            _fd = _FD_CACHE[file] = os.open(file, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+    # sysfs regenerates the contents when read from offset 0
+    return os.pread(_fd, _READ_SIZE, 0)
 
 
 def read_stat(file: str, stat_type: Optional[str] = None) -> str:
     """
     Read statistic `file`, return the stripped contents
 
+    The file is opened once and kept open; later reads use `os.pread` from the start
+
     Args:
         file (str): The statistic file to read/return
 
@@ -94,28 +300,119 @@ def read_stat(file: str, stat_type: Optional[str] = None) -> str:
     Returns:
         str: Statistics from `file`. If `stat_type='power'`, will convert mW to Watts
     """
-    if path.exists(file):
-        with open(file, "r", encoding="utf-8") as _fh:
-            data = _fh.read().strip()
-            if stat_type == 'power':
-                data = int(int(data) / 1000000)
-            return data
-    else:
+    if stat_type == 'power':
+        data = read_stat_int(file)
+        return None if data is None else data // 1000000
+    data = _read_raw(file)
+    if data is None:
+        return None
+    return data.decode('utf-8').strip()
+
+
+def read_stat_int(file: str) -> Optional[int]:
+    """
+    Read statistic `file` as an integer; most are, ie: clocks, temperatures, fan RPM
+
+    Parses the raw bytes directly, no decoding or stripping; `int` allows the trailing newline
+
+    Args:
+        file (str): The statistic file to read/return
+
+    Returns:
+        int: Statistic from `file`, as-is from the driver (no unit conversion)
+        None: If `file` doesn't exist
+    """
+    data = _read_raw(file)
+    if data is None:
         return None
+    return int(data)
 
 
+def read_stats_int(files: tuple) -> tuple:
+    """
+    Read several integer statistic `files` in one pass; see `read_stat_int`
+
+    For stats sampled together, ie: the power limits. Files are opened on first use,
+    afterwards each is a single `os.pread` on its cached file descriptor
+
+    Args:
+        files (tuple): The statistic files to read
+
+    Returns:
+        tuple: Statistics from `files`, in the same order. `None` for any that don't exist
+    """
+    pread = os.pread
+    stats = []
+    for file in files:
+        _fd = _FD_CACHE.get(file)
+        if _fd is None:
+            # first read; open and cache it
+            stats.append(read_stat_int(file))
+        else:
+            stats.append(int(pread(_fd, _READ_SIZE, 0)))
+    return tuple(stats)
+
+
+@lru_cache(maxsize=128)
 def format_frequency(frequency_hz: int) -> str:
     """
     Takes a frequency (in Hz) and normalizes it: `Hz`, `MHz`, or `GHz`
 
+    Results are cached; clocks settle on a few (DPM) levels, repeating often
+
     Returns:
-        str: frequency string with the appropriate suffix applied
+        str: frequency string with the appropriate suffix applied, ie: `2.6 GHz` or `659 MHz`
+    """
+    frequency_hz = int(frequency_hz)
+    for divisor, suffix in FREQUENCY_UNITS:
+        if frequency_hz >= divisor:
+            # at most two decimal places (rounded), trailing zeros dropped; integer math only
+            whole, hundredths = divmod((frequency_hz * 100 + divisor // 2) // divisor, 100)
+            if not hundredths:
+                return f"{whole} {suffix}"
+            if not hundredths % 10:
+                return f"{whole}.{hundredths // 10} {suffix}"
+            return f"{whole}.{hundredths:02d} {suffix}"
+    return f"{frequency_hz} Hz"
+
+
+def _read_power_stats(paths: CardPaths, power_files: tuple) -> dict:
     """
-    return (
-        format_size(frequency_hz, binary=False)
-        .replace("B", "Hz")
-        .replace("bytes", "Hz")
-    )
+    Reads the power stats in `power_files` together, converting them to Watts
+
+    Args:
+        paths (CardPaths): The card's stat file paths; see `get_card_paths()`
+        power_files (tuple): `(key, CardPaths field)` pairs, ie: `POWER_STATIC_FILES`
+
+    Returns:
+        dict: Power stats by key; `None` for any the card doesn't provide
+    """
+    _vals = read_stats_int(tuple(getattr(paths, stat_file) for _, stat_file in power_files))
+    return {key: None if val is None else val // 1000000 for (key, _), val in zip(power_files, _vals)}
+
+
+def _power_stats(paths: CardPaths) -> dict:
+    """Reads the power stats of a resolved card; see `get_power_stats()`"""
+    # the capability/default limits don't change; only read them the first time
+    _static = _POWER_STATIC.get(paths.hwmon_dir)
+    if _static is None:
+        _static = _POWER_STATIC[paths.hwmon_dir] = _read_power_stats(paths, POWER_STATIC_FILES)
+    _pwr = {'limit': read_stat(paths.power_cap, stat_type='power')}
+    _pwr.update(_static)
+    _pwr['usage_pct'] = 0
+    _pwr['usage'] = None
+
+    # different GPUs/drivers may offer either averaged or instant readouts [in different files]; adjust gracefully
+    # only the preferred file is read, the first one found
+    for usage_file in POWER_USAGE_FILES:
+        _pwr['usage'] = read_stat(getattr(paths, usage_file), stat_type='power')
+        if _pwr['usage'] is not None:
+            break
+
+    if _pwr['usage'] is not None:
+        _pwr['usage_pct'] = round((_pwr['usage'] / _pwr['limit']) * 100, 1)
+
+    return _pwr
 
 
 def get_power_stats(card: Optional[str] = None) -> dict:
@@ -131,26 +428,18 @@ def get_power_stats(card: Optional[str] = None) -> dict:
         dict: A dictionary of current GPU *power* related statistics.
 
         Example:
-            `{'limit': int, 'average': int, 'capability': int, 'default': int}`
+            `{'limit': int, 'capability': int, 'default': int, 'usage_pct': float, 'usage': int}`
     """
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-
-    _pwr = {"limit": read_stat(path.join(hwmon_dir, "power1_cap"), stat_type='power'),
-            "usage_pct": 0,
-            "usage": None,
-            "capability": read_stat(path.join(hwmon_dir, "power1_cap_max"), stat_type='power'),
-            "default": read_stat(path.join(hwmon_dir, "power1_cap_default"), stat_type='power')}
-
-    # different GPUs/drivers may offer either averaged or instant readouts [in different files]; adjust gracefully
-    for usage_file in (path.join(hwmon_dir, 'power1_input'), path.join(hwmon_dir, 'power1_average')):
-        if path.exists(usage_file):
-            _pwr['usage'] = read_stat(usage_file, stat_type='power')
+    return _power_stats(get_card_paths(card))
 
-    if _pwr['usage'] is not None:
-        _pwr['usage_pct'] = round((_pwr['usage'] / _pwr['limit']) * 100, 1)
 
-    return _pwr
+def _core_stats(paths: CardPaths) -> dict:
+    """Reads the core/memory stats of a resolved card together; see `get_core_stats()`"""
+    sclk, mclk, voltage, util_pct = read_stats_int((paths.sclk, paths.mclk, paths.voltage, paths.busy_pct))  # pylint: disable=unbalanced-tuple-unpacking
+    return {"sclk": sclk,
+            "mclk": mclk,
+            "voltage": None if voltage is None else round(voltage / 1000.0, 2),
+            "util_pct": util_pct}
 
 
 def get_core_stats(card: Optional[str] = None) -> dict:
@@ -171,11 +460,7 @@ def get_core_stats(card: Optional[str] = None) -> dict:
             `{'sclk': int, 'mclk': int, 'voltage': float, 'util_pct': int}`
     """
     # verify card -- is it AMD, do we know the hwmon directory?
-    card = validate_card(card)
-    return {"sclk": get_clock('core', card=card),
-            "mclk": get_clock('memory', card=card),
-            "voltage": get_voltage(card),
-            "util_pct": get_gpu_usage(card)}
+    return _core_stats(get_card_paths(card))
 
 
 def get_clock(domain: str, card: Optional[str] = None, format_freq: Optional[bool] = False) -> Union[int, str]:
@@ -201,22 +486,17 @@ def get_clock(domain: str, card: Optional[str] = None, format_freq: Optional[boo
         None:            The clock domain is invalid for *card*
     """
     # verify card -- is it AMD, do we know the hwmon directory?
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-    if domain not in CLOCK_DOMAINS:
+    paths = get_card_paths(card)
+    # find the clock file field based on requested domain
+    clock_field = _CLOCK_FIELDS.get(domain)
+    if clock_field is None:
         raise ValueError(f"Invalid clock domain: '{domain}'. Must be one of: {CLOCK_DOMAINS}")
-    # set the clock file based on requested domain
-    if domain == 'core':
-        clock_file = path.join(hwmon_dir, "freq1_input")
-    elif domain == 'memory':
-        clock_file = path.join(hwmon_dir, "freq2_input")
     # handle output processing
-    # check if clock file exists, if not - return 'none'
-    if path.exists(clock_file):  # pylint: disable=possibly-used-before-assignment
-        if format_freq:
-            return format_frequency(int(read_stat(clock_file)))
-        return int(read_stat(clock_file))
-    return None
+    # if the clock file doesn't exist, this is 'None'
+    clock = read_stat_int(getattr(paths, clock_field))
+    if format_freq and clock is not None:
+        return format_frequency(clock)
+    return clock
 
 
 def get_voltage(card: Optional[str] = None) -> float:
@@ -230,11 +510,12 @@ def get_voltage(card: Optional[str] = None) -> float:
 
     Returns:
         float: The current GPU core voltage
+        None: If *card* does not provide it
     """
     # verify card -- is it AMD, do we know the hwmon directory?
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-    return round(int(read_stat(path.join(hwmon_dir, "in0_input"))) / 1000.0, 2)
+    paths = get_card_paths(card)
+    voltage = read_stat_int(paths.voltage)
+    return None if voltage is None else round(voltage / 1000.0, 2)
 
 
 def get_fan_rpm(card: Optional[str] = None) -> int:
@@ -252,12 +533,8 @@ def get_fan_rpm(card: Optional[str] = None) -> int:
         None: If *card* does not have a fan
     """
     # verify card -- is it AMD, do we know the hwmon directory?
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-    _val = read_stat(path.join(hwmon_dir, "fan1_input"))
-    if _val is not None:
-        _val = int(_val)
-    return _val
+    paths = get_card_paths(card)
+    return read_stat_int(paths.fan_input)
 
 
 def get_fan_target(card: Optional[str] = None) -> int:
@@ -273,9 +550,8 @@ def get_fan_target(card: Optional[str] = None) -> int:
         int: The *target* fan RPM
     """
     # verify card -- is it AMD, do we know the hwmon directory?
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-    return int(read_stat(path.join(hwmon_dir, "fan1_target")))
+    paths = get_card_paths(card)
+    return read_stat_int(paths.fan_target)
 
 
 def get_gpu_usage(card: Optional[str] = None) -> int:
@@ -290,9 +566,7 @@ def get_gpu_usage(card: Optional[str] = None) -> int:
     Returns:
         int: The current GPU usage/utilization as a percentage
     """
-    card = validate_card(card)
-    stat_file = path.join("/sys/class/drm/", card, "device/gpu_busy_percent")
-    return int(read_stat(stat_file))
+    return read_stat_int(get_card_paths(card).busy_pct)
 
 
 def get_available_temps(card: Optional[str] = None) -> dict:
@@ -311,21 +585,8 @@ def get_available_temps(card: Optional[str] = None) -> dict:
         Example:
             `{'edge': '/.../temp1_input', 'junction': '/.../temp2_input', 'mem': '/.../temp3_input'}`
     """
-    card = validate_card(card)
-    hwmon_dir = CARDS[card]
-    # determine temperature nodes/types, construct a dict to store them
-    temp_files = {}
-    temp_node_labels = glob.glob(path.join(hwmon_dir, "temp*_label"))
-    for temp_node_label_file in temp_node_labels:
-        # determine the base node id, eg: temp1
-        # construct the path to the file that will label it. ie: edge/junction
-        temp_node_id = path.basename(temp_node_label_file).split('_')[0]
-        temp_node_value_file = path.join(hwmon_dir, f"{temp_node_id}_input")
-        with open(temp_node_label_file, 'r', encoding='utf-8') as _node:
-            temp_node_name = _node.read().strip()
-        # add the node name/type and the corresponding temp file to the dict
-        temp_files[temp_node_name] = temp_node_value_file
-    return temp_files
+    # found at discovery; copied so callers can't alter them
+    return dict(get_card_paths(card).temp_nodes)
 
 
 def get_temp_stat(name: str, card: Optional[str] = None) -> dict:
@@ -345,14 +606,68 @@ def get_temp_stat(name: str, card: Optional[str] = None) -> dict:
         Driver provides temperatures in *millidegrees* C
 
         Returned values are converted to 'C' as integers for simple comparison
+
+        None: If the temperature `name` is not provided, or can't be read
     """
-    card = validate_card(card)
-    # determine temperature nodes/types, construct a dict to store them
-    temp_files = get_available_temps(card=card)
+    temp_files = get_card_paths(card).temp_nodes
 
     # now that we know the temperature nodes/types for 'card', check request
     if name not in temp_files:
         return None
 
     # if the requested temperature node was found, read it / convert to C
-    return int(int(read_stat(temp_files[name])) // 1000)
+    temp = read_stat_int(temp_files[name])
+    return None if temp is None else temp // 1000
+
+
+def _temp_stats(paths: CardPaths) -> dict:
+    """Reads all temperatures of a resolved card in one pass; see `get_temp_stats()`"""
+    temp_nodes = paths.temp_nodes
+    temps = read_stats_int(tuple(temp_nodes.values()))
+    return {name: None if temp is None else temp // 1000 for name, temp in zip(temp_nodes, temps)}
+
+
+def get_temp_stats(card: Optional[str] = None) -> dict:
+    """
+    Args:
+        card (str, optional): ie: `card0`. See `CARDS` or `find_cards()`
+
+    Raises:
+        ValueError: If *no* AMD cards are found, or `card` is not one of them.
+
+    Returns:
+        dict: All temperatures provided by the card, by *name*; in 'C' as integers
+
+        Temperature nodes are found once, at discovery; see `CardPaths`
+
+        Example:
+            `{'edge': 41, 'junction': 42, 'mem': 43}`
+    """
+    return _temp_stats(get_card_paths(card))
+
+
+def get_all_stats(card: Optional[str] = None) -> dict:
+    """
+    Args:
+        card (str, optional): ie: `card0`. See `CARDS` or `find_cards()`
+
+    Raises:
+        ValueError: If *no* AMD cards are found, or `card` is not one of them.
+            Determined with `CARDS`
+
+    Returns:
+        dict: `get_core_stats()` and `get_power_stats()` merged, with the fan RPM and `get_temp_stats()`
+
+        The card is resolved once for all of them; meant for sampling everything, ie: the TUI
+
+        Example:
+            `{'sclk': int, 'mclk': int, 'voltage': float, 'util_pct': int,
+              'limit': int, 'capability': int, 'default': int, 'usage_pct': float, 'usage': int,
+              'fan_rpm': int, 'temps': {'edge': int, 'junction': int, 'mem': int}}`
+    """
+    paths = get_card_paths(card)
+    stats = _core_stats(paths)
+    stats.update(_power_stats(paths))
+    stats['fan_rpm'] = read_stat_int(paths.fan_input)
+    stats['temps'] = _temp_stats(paths)
+    return stats